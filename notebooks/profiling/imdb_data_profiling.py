@@ -8,11 +8,14 @@
 # Output:
 #   - HTML profiling reports (one per dataset)  → docs/data_profiling/
 #   - Summary markdown file                     → docs/data_profiling/profiling_summary.md
+#   - Cached stats + input manifest             → docs/data_profiling/<dataset>_stats.json, manifest.json
 #
 # Usage:
 #   Option A (Local Python):
-#       pip install pandas ydata-profiling
+#       pip install pandas pyarrow ydata-profiling
 #       python profiling/imdb_data_profiling.py
+#       python profiling/imdb_data_profiling.py --engine=polars   # pip install polars
+#       python profiling/imdb_data_profiling.py --keys-only       # PK checks only
 #
 #   Option B (Databricks):
 #       Copy cells into a Databricks notebook
@@ -24,16 +27,133 @@
 # ============================================================
 
 import os
+import gzip
+import json
+import argparse
+import importlib.util
+import multiprocessing
+import tempfile
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+import pyarrow.parquet as pq
+from pyarrow import feather
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 
+# ============================================================
+# CONFIGURATION — Update these paths to match your setup
+# ============================================================
+# Module scope so worker processes (see main) see the same settings
+# when they import this file.
+
+# Project root (IMDB_Project) so paths are consistent
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Where your raw .tsv files are stored (unzipped)
+RAW_DATA_DIR = os.path.join(ROOT_DIR, "data")
+
+# Where profiling outputs will be saved
+OUTPUT_DIR = os.path.join(ROOT_DIR, "docs", "profiling")
+
+# Bytes of TSV parsed per streamed chunk — peak memory scales with this,
+# not with file size
+CHUNK_SIZE_BYTES = 64 << 20
+
+# Cache each TSV as a zstd Parquet file next to it on first read; later runs
+# profile from the snapshot (rebuilt automatically if the TSV is newer)
+PARQUET_SNAPSHOTS = True
+
+# Input (size, mtime) of every profiled dataset; a re-run reuses the cached
+# <dataset>_stats.json for any dataset whose input has not changed
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+# -----------------------------------------------------------
+# DATASET DEFINITIONS
+# -----------------------------------------------------------
+# Each entry: (filename, description, expected_key, multi_value_columns)
+# categorical_columns: low-cardinality columns read dictionary-encoded
+
+DATASETS = {
+    "name_basics": {
+        "file": "name.basics.tsv",
+        "description": "Cast & crew personnel details",
+        "primary_key": "nconst",
+        "multi_value_columns": ["primaryProfession", "knownForTitles"],
+        "multi_value_separator": ",",
+        "null_marker": "\\N",  # IMDb uses \N for nulls
+    },
+    "title_basics": {
+        "file": "title.basics.tsv",
+        "description": "Title metadata and genres",
+        "primary_key": "tconst",
+        "categorical_columns": ["titleType", "isAdult"],
+        "multi_value_columns": ["genres"],
+        "multi_value_separator": ",",
+        "null_marker": "\\N",
+    },
+    "title_akas": {
+        "file": "title.akas.tsv",
+        "description": "Localized title names (multi-language/region)",
+        "primary_key": None,  # Composite: titleId + ordering
+        "composite_key": ["titleId", "ordering"],
+        "categorical_columns": ["region", "language", "types", "attributes", "isOriginalTitle"],
+        "multi_value_columns": [],
+        "multi_value_separator": None,
+        "null_marker": "\\N",
+    },
+    "title_crew": {
+        "file": "title.crew.tsv",
+        "description": "Directors and writers per title",
+        "primary_key": "tconst",
+        "multi_value_columns": ["directors", "writers"],
+        "multi_value_separator": ",",
+        "null_marker": "\\N",
+    },
+    "title_episode": {
+        "file": "title.episode.tsv",
+        "description": "Series ↔ episode relationships",
+        "primary_key": "tconst",
+        "multi_value_columns": [],
+        "multi_value_separator": None,
+        "null_marker": "\\N",
+    },
+    "title_principals": {
+        "file": "title.principals.tsv",
+        "description": "Principal cast/crew credits per title",
+        "primary_key": None,  # Composite: tconst + ordering
+        "composite_key": ["tconst", "ordering"],
+        "categorical_columns": ["category", "job"],
+        "multi_value_columns": [],
+        "multi_value_separator": None,
+        "null_marker": "\\N",
+    },
+    "title_ratings": {
+        "file": "title.ratings.tsv",
+        "description": "Average ratings and vote counts",
+        "primary_key": "tconst",
+        "multi_value_columns": [],
+        "multi_value_separator": None,
+        "null_marker": "\\N",
+    },
+}
+
+
 # ============================================================
 # STEP 1: LOAD AND BASIC PROFILING (Manual — always runs)
 # ============================================================
 
-def load_dataset(dataset_name, config):
-    """Load a single IMDb TSV dataset into a pandas DataFrame."""
+# Arrow type for categorical_columns: int32 codes into a per-chunk dictionary
+CATEGORY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+def resolve_dataset_path(config):
+    """Return the path of a dataset's TSV, falling back to .gz (None if missing)."""
     filepath = os.path.join(RAW_DATA_DIR, config["file"])
 
     if not os.path.exists(filepath):
@@ -46,133 +166,768 @@ def load_dataset(dataset_name, config):
             print(f"  ❌ File not found: {filepath} (or .gz)")
             return None
 
-    print(f"  📂 Loading {filepath}...")
+    return filepath
+
+
+def key_columns(config):
+    """Columns needed to validate a dataset's key: the PK (or composite key)
+    plus its multi-value columns."""
+    keys = [config["primary_key"]] if config.get("primary_key") else config.get("composite_key", [])
+    return list(keys) + list(config.get("multi_value_columns", []))
+
+
+def load_dataset(dataset_name, config, columns=None):
+    """Open a single IMDb TSV dataset as an iterator of pandas DataFrame chunks.
+
+    columns restricts the read to a subset (e.g. key_columns); other columns
+    are skipped by the parser rather than loaded and dropped.
+    """
+    filepath = resolve_dataset_path(config)
+    if filepath is None:
+        return None
+
+    snapshot = snapshot_path(filepath)
+    if PARQUET_SNAPSHOTS and _is_fresh(snapshot, filepath):
+        # Re-run: skip TSV parsing entirely, one chunk per row group
+        print(f"  ⚡ Reading Parquet snapshot {snapshot}...")
+        return _iter_chunks(_iter_row_groups(snapshot, columns=columns))
+
+    print(f"  📂 Streaming {filepath}...")
+    categorical = set(config.get("categorical_columns", []))
 
-    df = pd.read_csv(
+    # PyArrow's multi-threaded C++ parser (handles .gz transparently),
+    # yielding one record batch per CHUNK_SIZE_BYTES of input
+    header = _read_header(filepath)
+    reader = pa_csv.open_csv(
         filepath,
-        sep="\t",
-        na_values=["\\N"],       # IMDb uses \N for null
-        low_memory=False,
-        dtype=str,               # Load everything as string first
-        quoting=3,               # QUOTE_NONE — IMDb TSVs have no quoting
+        read_options=pa_csv.ReadOptions(block_size=CHUNK_SIZE_BYTES, use_threads=True),
+        parse_options=pa_csv.ParseOptions(
+            delimiter="\t",
+            quote_char=False,        # QUOTE_NONE — IMDb TSVs have no quoting
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            null_values=["\\N"],     # IMDb uses \N for null
+            strings_can_be_null=True,
+            # Load everything as string first; known low-cardinality columns
+            # are dictionary-encoded (int32 codes + small dictionary)
+            column_types={
+                c: CATEGORY_TYPE if c in categorical else pa.string()
+                for c in header
+            },
+            include_columns=[c for c in header if c in columns] if columns else None,
+        ),
     )
+    if PARQUET_SNAPSHOTS and not columns:
+        # First run: write the snapshot from the same batches we profile
+        # (only from full reads — a column subset would be an incomplete snapshot)
+        reader = _tee_to_parquet(reader, snapshot)
+    return _iter_chunks(reader)
 
-    print(f"  ✅ Loaded {len(df):,} rows × {len(df.columns)} columns")
-    return df
 
+def snapshot_path(filepath):
+    """Parquet snapshot next to a TSV: name.basics.tsv(.gz) → name.basics.parquet."""
+    base = filepath[:-len(".gz")] if filepath.endswith(".gz") else filepath
+    return os.path.splitext(base)[0] + ".parquet"
 
-def profile_dataset_manual(dataset_name, df, config):
-    """Generate manual profiling stats for a dataset."""
 
-    stats = {
+def _is_fresh(snapshot, source):
+    """True if the snapshot exists and is at least as new as its source file."""
+    return (
+        os.path.exists(snapshot)
+        and os.path.getmtime(snapshot) >= os.path.getmtime(source)
+    )
+
+
+def _tee_to_parquet(reader, snapshot):
+    """Yield the reader's batches while writing them to a zstd Parquet file.
+
+    Writes to a .tmp file and only renames it into place once the whole
+    source has been read, so an interrupted run never leaves a truncated
+    snapshot behind.
+    """
+    tmp_path = snapshot + ".tmp"
+    completed = False
+    try:
+        with pq.ParquetWriter(tmp_path, reader.schema, compression="zstd") as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                yield batch
+        completed = True
+    finally:
+        if completed:
+            os.replace(tmp_path, snapshot)
+            print(f"  💾 Saved Parquet snapshot: {snapshot}")
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _iter_row_groups(snapshot, columns=None):
+    """Yield a Parquet snapshot one row group (Arrow table) at a time."""
+    pf = pq.ParquetFile(snapshot)
+    for i in range(pf.num_row_groups):
+        yield pf.read_row_group(i, columns=columns)
+
+
+def _to_pandas_dtype(arrow_type):
+    """Arrow-backed strings, except dictionaries which become pd.Categorical."""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _iter_chunks(reader):
+    """Convert each Arrow record batch (or table) to an Arrow-backed pandas DataFrame."""
+    for batch in reader:
+        # self_destruct frees the batch buffers as each pandas column is built
+        yield batch.to_pandas(
+            types_mapper=_to_pandas_dtype, split_blocks=True, self_destruct=True
+        )
+
+
+def _read_header(filepath):
+    """Read the column names from the header line of a TSV (or .tsv.gz)."""
+    opener = gzip.open if filepath.endswith(".gz") else open
+    with opener(filepath, "rt", encoding="utf-8") as f:
+        return f.readline().rstrip("\r\n").split("\t")
+
+
+# Columns stay exactly counted until they pass this many distinct values;
+# beyond it only the HyperLogLog sketch is kept
+EXACT_DISTINCT_LIMIT = 100_000
+
+
+class HyperLogLog:
+    """Fixed-size (2**p bytes) distinct-count sketch, updated a chunk at a time.
+
+    Values (strings, or numeric arrays such as parsed IDs) are hashed with
+    pandas' vectorised 64-bit hash, so an update is a handful of numpy
+    passes rather than a Python loop. Standard error is
+    about 1.04 / sqrt(2**p) (~0.8% at p=14).
+
+    Arrow updates are also kept as an exact distinct set while it holds at
+    most exact_limit values, so low-cardinality columns report exact counts
+    and only the large ones fall back to the estimate.
+    """
+
+    def __init__(self, p=14, exact_limit=EXACT_DISTINCT_LIMIT):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+        self.exact_limit = exact_limit
+        self.exact = None         # pa.Array of distinct values, while small
+        self.saturated = False    # True once only the sketch is trustworthy
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        if isinstance(values, pa.Array):
+            self._update_exact(values)
+            values = values.to_numpy(zero_copy_only=False)
+        else:
+            self.saturated = True
+        values = np.asarray(values)
+        if values.dtype.kind not in "iuf":
+            values = values.astype(object)
+        hashes = pd.util.hash_array(values)
+
+        # First p bits pick the register, the rest give the rank
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = (hashes << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))
+
+        # Rank = leading zeros + 1, counted by binary search on the bits
+        rank = np.ones(len(rest), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            top_clear = rest < np.uint64(1 << (64 - shift))
+            rank[top_clear] += shift
+            rest[top_clear] <<= np.uint64(shift)
+
+        np.maximum.at(self.registers, idx, rank)
+
+    def _update_exact(self, values):
+        if self.saturated:
+            return
+        if self.exact is not None:
+            if self.exact.type != values.type:
+                # e.g. IDs parsed as int32 in one chunk, left as strings in
+                # another: the two sets are not comparable
+                self.saturated, self.exact = True, None
+                return
+            values = pc.unique(pa.concat_arrays([self.exact, values]))
+        if len(values) > self.exact_limit:
+            self.saturated, self.exact = True, None
+        else:
+            self.exact = values
+
+    def estimate(self):
+        if not self.saturated and self.exact is not None:
+            return len(self.exact)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+def init_stats(dataset_name, config, sample_size=1_000_000):
+    """Create the running state that update_stats accumulates into."""
+    return {
         "dataset": dataset_name,
+        "config": config,
+        "row_count": 0,
+        "columns": None,              # filled in from the first chunk
+        "multi_value": {},
+        "pk_null_count": 0,
+        "pk_chunk_keys": [],          # per-chunk distinct (non-null) keys
+        "pk_unparsed_keys": [],       # ... of keys that don't parse as IDs
+        "sample_size": sample_size,
+        "sample": None,               # bottom-k rows by random key
+        "sample_keys": np.empty(0),
+        "rng": np.random.default_rng(42),
+    }
+
+
+def update_stats(state, chunk):
+    """Fold one chunk into the running profiling state."""
+    config = state["config"]
+
+    if state["columns"] is None:
+        state["columns"] = {
+            col: {
+                "pandas_dtype": str(chunk[col].dtype),
+                # Dictionary columns hold strings even when a chunk is all-null
+                "is_string": pd.api.types.is_string_dtype(chunk[col])
+                or isinstance(chunk[col].dtype, pd.CategoricalDtype),
+                "null_count": 0,
+                # The PK is counted exactly elsewhere; don't keep a second set
+                "distinct": HyperLogLog(
+                    exact_limit=0 if col == config.get("primary_key") else EXACT_DISTINCT_LIMIT
+                ),
+                # ID columns: malformed IDs are counted as strings, apart
+                # from the int32-parsed ones (see _valid_ids)
+                "malformed_id_count": 0,
+                "malformed_distinct": HyperLogLog(
+                    exact_limit=0 if col == config.get("primary_key") else EXACT_DISTINCT_LIMIT
+                ),
+                "head": [],           # first 1000 non-null values
+                "empty_string_count": 0,
+                "none_literal_count": 0,
+                "unknown_literal_count": 0,
+            }
+            for col in chunk.columns
+        }
+        for mv_col in config.get("multi_value_columns", []):
+            if mv_col in chunk.columns:
+                state["multi_value"][mv_col] = {
+                    "rows": 0, "min": None, "max": None, "sum": 0,
+                    "value_counts": Counter(),
+                }
+
+    state["row_count"] += len(chunk)
+    pk = config.get("primary_key")
+    ck = config.get("composite_key")
+
+    # ----- Per-Column Analysis -----
+    for col, cs in state["columns"].items():
+        # One zero-copy Arrow view of the column feeds every stat below
+        # (no per-stat pandas temporaries)
+        arr = pa.array(chunk[col], from_pandas=True)
+        is_dict = pa.types.is_dictionary(arr.type)
+
+        # Null analysis (remember: \N was already converted to null on read)
+        cs["null_count"] += arr.null_count
+
+        non_null = pc.drop_null(arr)
+
+        # Cardinality (exact while small, then HyperLogLog — see the class).
+        # IMDb IDs are hashed as int32 rather than as variable-length strings;
+        # malformed ones are kept apart as strings, so every value has the
+        # same representation in every chunk
+        if col in ID_COLUMNS:
+            valid = _valid_ids(non_null, col)
+            uniques = pc.unique(_id_numbers(non_null.filter(valid)))
+            malformed = pc.unique(non_null.filter(pc.invert(valid)))
+            cs["malformed_id_count"] += len(non_null) - (pc.sum(valid).as_py() or 0)
+            cs["malformed_distinct"].update(malformed)
+            if col == pk and len(malformed):
+                state["pk_unparsed_keys"].append(malformed)
+        else:
+            uniques = pc.unique(non_null)
+            if is_dict:
+                # (cast: an all-null chunk's dictionary has type null)
+                uniques = uniques.dictionary_decode().cast(pa.string())
+        cs["distinct"].update(uniques)
+        if col == pk:
+            # PK validation reuses the same uniques instead of re-hashing
+            state["pk_chunk_keys"].append(uniques)
+
+        # Sample values / numeric probe draw from the first 1000 non-null
+        if len(cs["head"]) < 1000:
+            cs["head"].extend(non_null.slice(0, 1000 - len(cs["head"])).to_pylist())
+
+        # Check for "none", "unknown", empty strings
+        if cs["is_string"]:
+            values, weights = non_null, None
+            if is_dict:
+                # Check each category once, weighted by how often it occurs
+                values = non_null.dictionary.cast(pa.string())
+                weights = np.bincount(non_null.indices.to_numpy(), minlength=len(values))
+            empty, none, unknown = _quality_flag_counts(values, weights)
+            cs["empty_string_count"] += empty
+            cs["none_literal_count"] += none
+            cs["unknown_literal_count"] += unknown
+
+    # ----- Multi-Value Field Analysis -----
+    sep = config.get("multi_value_separator")
+    for mv_col, mv in state["multi_value"].items():
+        values = pc.drop_null(pa.array(chunk[mv_col], from_pandas=True)).cast(pa.string())
+        if len(values) == 0:
+            continue
+
+        # Split once in Arrow; lengths come straight off the ListArray offsets
+        # and the flattened values are counted in C++ (no Python lists)
+        splits = pc.split_pattern(values, pattern=sep)
+
+        # Count values per cell
+        lengths = pc.list_value_length(splits)
+        bounds = pc.min_max(lengths)
+        mv["rows"] += len(lengths)
+        mv["sum"] += pc.sum(lengths).as_py()
+        chunk_min, chunk_max = bounds["min"].as_py(), bounds["max"].as_py()
+        mv["min"] = chunk_min if mv["min"] is None else min(mv["min"], chunk_min)
+        mv["max"] = chunk_max if mv["max"] is None else max(mv["max"], chunk_max)
+
+        # Unsorted per-chunk counts merged into the running Counter; only the
+        # final top-10 needs ordering (see finalize_stats)
+        counts = pc.value_counts(pc.list_flatten(splits))
+        mv["value_counts"].update(dict(zip(
+            counts.field("values").to_pylist(), counts.field("counts").to_pylist()
+        )))
+
+    # ----- Primary Key Validation -----
+    # (single-column PK: nulls and uniques are collected in the column loop)
+    if not pk and ck:
+        keys = chunk[ck]
+        has_null = keys.isna().any(axis=1)
+        state["pk_null_count"] += int(has_null.sum())
+        packed, hashed = _composite_key_codes(keys[~has_null], ck)
+        state["pk_chunk_keys"].append(pc.unique(pa.array(packed)))
+        if len(hashed):
+            state["pk_unparsed_keys"].append(pc.unique(pa.array(hashed)))
+
+    if state["sample_size"]:
+        _update_report_sample(state, chunk)
+
+
+# IMDb identifier columns and their fixed prefix ("tt0000001", "nm0000001")
+ID_COLUMNS = {"tconst": "tt", "nconst": "nm", "titleId": "tt", "parentTconst": "tt"}
+
+# Canonical IDs and orderings, the only ones parsed to integers: the
+# column's prefix + a number zero-padded to 7 digits (8-9 digits, no leading
+# zero, past 9,999,999), and orderings without leading zeros. The number
+# then maps back to exactly one string, so distinct values never share a
+# key ("nm000005" or "tt01" are malformed, not 5 and 1). At most 9 digits,
+# so they fit in an int32.
+ID_PATTERNS = {
+    col: rf"^{prefix}(?:[0-9]{{7}}|[1-9][0-9]{{7,8}})$" for col, prefix in ID_COLUMNS.items()
+}
+ORDERING_PATTERN = r"^[1-9][0-9]{0,8}$"
+
+
+def _as_string_array(values):
+    """Values as an Arrow array (as-is if already Arrow, else as strings)."""
+    if isinstance(values, pa.Array):
+        return values
+    return pa.array(values, type=pa.string(), from_pandas=True)
+
+
+def _valid_ids(values, col):
+    """Arrow boolean mask of the values that are canonical IDs for col.
+
+    Decided per value, not per chunk, so an ID is parsed (or not) the same
+    way wherever it appears.
+    """
+    return pc.match_substring_regex(_as_string_array(values), ID_PATTERNS[col])
+
+
+def _id_numbers(ids):
+    """Numeric part of canonical IMDb IDs (see _valid_ids) as int32."""
+    return pc.cast(pc.utf8_slice_codeunits(ids, 2), pa.int32())
+
+
+def _composite_key_codes(keys, ck):
+    """Integer codes for the rows of a (non-null) composite key: (packed, hashed).
+
+    (ID, ordering) rows that parse pack exactly into an int64 — ID in the
+    high 32 bits — so distinct counting is a 64-bit integer op and sorted
+    input stays sorted. The remaining rows (all of them for other key
+    shapes) get a per-row 64-bit hash. Which set a row lands in depends only
+    on its values, so the two sets can be counted separately and summed.
+    """
+    packable = np.zeros(len(keys), dtype=bool)
+    packed = np.empty(0, dtype=np.int64)
+    if len(ck) == 2 and ck[0] in ID_COLUMNS:
+        ids = _as_string_array(keys[ck[0]])
+        ordering = _as_string_array(keys[ck[1]])
+        mask = pc.and_(_valid_ids(ids, ck[0]), pc.match_substring_regex(ordering, ORDERING_PATTERN))
+        id_numbers = _id_numbers(ids.filter(mask)).to_numpy().astype(np.int64)
+        packed = (id_numbers << 32) | pc.cast(ordering.filter(mask), pa.int64()).to_numpy()
+        packable = mask.to_numpy(zero_copy_only=False)
+    hashed = pd.util.hash_pandas_object(keys[~packable], index=False).to_numpy()
+    return packed, hashed
+
+
+# Literals flagged by the data-quality check, matched after trim + lowercase
+QUALITY_FLAG_VALUES = pa.array(["none", "unknown"])
+
+
+def _quality_flag_counts(values, weights=None):
+    """Count (empty, 'none', 'unknown') cells in one Arrow pass.
+
+    Trims with Arrow's UTF-8 kernel once; empty cells are those whose trimmed
+    byte length is 0 (no string comparison), and the lowercased cells are
+    mapped to their position in QUALITY_FLAG_VALUES (2 = no match) and
+    bincounted. Counts are optionally weighted (e.g. by category frequency).
+    """
+    arr = _as_string_array(values)
+    stripped = pc.utf8_trim_whitespace(arr)
+    is_empty = pc.equal(pc.binary_length(stripped), 0)
+    if weights is None:
+        empty = pc.sum(is_empty).as_py() or 0
+    else:
+        empty = weights[is_empty.to_numpy(zero_copy_only=False)].sum()
+    idx = pc.index_in(pc.utf8_lower(stripped), value_set=QUALITY_FLAG_VALUES).fill_null(2)
+    counts = np.bincount(idx.to_numpy(), weights=weights, minlength=3)
+    return int(empty), int(counts[0]), int(counts[1])
+
+
+def _update_report_sample(state, chunk):
+    """Keep the sample_size rows with the smallest random keys (uniform sample)."""
+    k = state["sample_size"]
+    keys = state["rng"].random(len(chunk))
+
+    if state["sample"] is not None:
+        frames = [state["sample"], chunk]
+        for col in chunk.columns:
+            if isinstance(chunk[col].dtype, pd.CategoricalDtype):
+                # Each chunk has its own dictionary; align them so concat
+                # stays categorical instead of falling back to object
+                cats = union_categoricals([f[col] for f in frames]).categories
+                frames = [f.assign(**{col: f[col].cat.set_categories(cats)}) for f in frames]
+        chunk = pd.concat(frames, ignore_index=True)
+        keys = np.concatenate([state["sample_keys"], keys])
+
+    if len(chunk) > k:
+        keep = np.argpartition(keys, k)[:k]
+        chunk = chunk.iloc[keep].reset_index(drop=True)
+        keys = keys[keep]
+
+    state["sample"] = chunk
+    state["sample_keys"] = keys
+
+
+def finalize_stats(state):
+    """Turn the running state into the per-dataset stats dict.
+
+    Returns (stats, sample) where sample is a uniform random sample of up to
+    sample_size rows, in no particular order (any uniformly drawn subset of
+    it, e.g. via _subsample_positions, is itself uniform).
+    """
+    config = state["config"]
+    row_count = state["row_count"]
+    columns = state["columns"] or {}
+
+    stats = {
+        "dataset": state["dataset"],
         "description": config["description"],
         "file": config["file"],
-        "row_count": len(df),
-        "column_count": len(df.columns),
+        "row_count": row_count,
+        "column_count": len(columns),
         "columns": {},
         "multi_value_analysis": {},
     }
 
+    pk = config.get("primary_key")
+    ck = config.get("composite_key")
+
+    # Exact distinct count for a single-column PK (the sketch is for the rest)
+    exact_unique = {}
+    if pk in columns:
+        exact_unique[pk] = (
+            _count_distinct_keys(state["pk_chunk_keys"])
+            + _count_distinct_keys(state["pk_unparsed_keys"])
+        )
+
     # ----- Per-Column Analysis -----
-    for col in df.columns:
-        col_stats = {}
+    for col, cs in columns.items():
+        null_count = cs["null_count"]
+        unique_count = exact_unique.get(col)
+        if unique_count is None:
+            estimate = cs["distinct"].estimate() + cs["malformed_distinct"].estimate()
+            unique_count = min(estimate, row_count - null_count)
+
+        col_stats = {
+            # Data type (as loaded — all string, but detect actual type)
+            "pandas_dtype": cs["pandas_dtype"],
+            "null_count": null_count,
+            "null_percentage": round((null_count / row_count) * 100, 2) if row_count else 0,
+            "unique_count": unique_count,
+            "cardinality_ratio": round((unique_count / row_count) * 100, 2) if row_count else 0,
+            # Sample values (first 5 non-null)
+            "sample_values": cs["head"][:5],
+        }
+        if col in ID_COLUMNS:
+            col_stats["malformed_id_count"] = cs["malformed_id_count"]
 
-        # Data type (as loaded — all string, but detect actual type)
-        col_stats["pandas_dtype"] = str(df[col].dtype)
+        if cs["is_string"]:
+            col_stats["empty_string_count"] = cs["empty_string_count"]
+            col_stats["none_literal_count"] = cs["none_literal_count"]
+            col_stats["unknown_literal_count"] = cs["unknown_literal_count"]
 
-        # Null analysis (remember: \N was already converted to NaN by na_values)
-        null_count = df[col].isna().sum()
-        col_stats["null_count"] = int(null_count)
-        col_stats["null_percentage"] = round((null_count / len(df)) * 100, 2)
+            # Detect if numeric
+            col_stats["likely_numeric"] = _likely_numeric(cs["head"])
 
-        # Cardinality
-        col_stats["unique_count"] = int(df[col].nunique())
-        col_stats["cardinality_ratio"] = round(
-            (df[col].nunique() / len(df)) * 100, 2
+        stats["columns"][col] = col_stats
+
+    # ----- Multi-Value Field Analysis -----
+    for mv_col, mv in state["multi_value"].items():
+        stats["multi_value_analysis"][mv_col] = {
+            "min_values_per_row": mv["min"] or 0,
+            "max_values_per_row": mv["max"] or 0,
+            "avg_values_per_row": round(mv["sum"] / mv["rows"], 2) if mv["rows"] > 0 else 0,
+            "total_distinct_values": len(mv["value_counts"]),
+            # most_common(n) is a heapq.nlargest partial top-K, not a full sort
+            "top_10_values": dict(mv["value_counts"].most_common(10)),
+        }
+
+    # ----- Primary Key Validation -----
+    if pk in columns:
+        # Pure algebra on counts we already have — no duplicated() hash
+        pk_nulls = columns[pk]["null_count"]
+        pk_dupes = (row_count - pk_nulls) - exact_unique[pk]
+        stats["primary_key"] = {
+            "column": pk,
+            "null_count": pk_nulls,
+            "duplicate_count": pk_dupes,
+            "is_valid_pk": pk_nulls == 0 and pk_dupes == 0,
+        }
+    elif ck and state["pk_chunk_keys"]:
+        pk_nulls = state["pk_null_count"]
+        pk_dupes = (row_count - pk_nulls) - (
+            _count_distinct_keys(state["pk_chunk_keys"])
+            + _count_distinct_keys(state["pk_unparsed_keys"])
         )
+        stats["primary_key"] = {
+            "column": ck,
+            "null_count": pk_nulls,
+            "duplicate_count": pk_dupes,
+            "is_valid_pk": pk_nulls == 0 and pk_dupes == 0,
+        }
 
-        # Sample values (first 5 non-null)
-        non_null_vals = df[col].dropna().head(5).tolist()
-        col_stats["sample_values"] = non_null_vals
+    return stats, state["sample"]
 
-        # Check for "none", "unknown", empty strings
-        if df[col].dtype == "object":
-            temp_col = df[col].str.strip()
-            empty_count = (temp_col == "").sum()
-            none_count = (temp_col.str.lower() == "none").sum()
-            unknown_count = (temp_col.str.lower() == "unknown").sum()
-            col_stats["empty_string_count"] = int(empty_count)
-            col_stats["none_literal_count"] = int(none_count)
-            col_stats["unknown_literal_count"] = int(unknown_count)
-
-        # Detect if numeric
-        if df[col].dtype == "object":
-            sample = df[col].dropna().head(1000)
-            numeric_count = pd.to_numeric(sample, errors="coerce").notna().sum()
-            col_stats["likely_numeric"] = numeric_count > (len(sample) * 0.8)
 
-        stats["columns"][col] = col_stats
+def _count_distinct_keys(chunk_uniques):
+    """Exact distinct count over the per-chunk unique keys of a PK.
 
-    # ----- Multi-Value Field Analysis -----
-    for mv_col in config.get("multi_value_columns", []):
-        if mv_col in df.columns:
-            sep = config["multi_value_separator"]
-            non_null = df[mv_col].dropna()
-
-            # Count values per cell
-            value_counts = non_null.str.split(sep).str.len()
-
-            mv_stats = {
-                "min_values_per_row": int(value_counts.min()) if len(value_counts) > 0 else 0,
-                "max_values_per_row": int(value_counts.max()) if len(value_counts) > 0 else 0,
-                "avg_values_per_row": round(value_counts.mean(), 2) if len(value_counts) > 0 else 0,
-                "total_distinct_values": int(
-                    non_null.str.split(sep).explode().nunique()
-                ),
-                "top_10_values": (
-                    non_null.str.split(sep)
-                    .explode()
-                    .value_counts()
-                    .head(10)
-                    .to_dict()
-                ),
-            }
+    IMDb dumps are sorted by key, so the concatenated uniques are normally
+    strictly increasing: one comparison pass then proves there are no
+    repeats across chunks, without building a hash table. Otherwise fall
+    back to Arrow's hash-based count_distinct.
+    """
+    if not chunk_uniques:
+        return 0
+    keys = pa.concat_arrays(chunk_uniques)
+    if len(keys) < 2 or pc.all(pc.greater(keys[1:], keys[:-1])).as_py():
+        return len(keys)
+    return pc.count_distinct(keys).as_py()
 
-            stats["multi_value_analysis"][mv_col] = mv_stats
 
-    # ----- Primary Key Validation -----
+# Integer / decimal / exponent literals, as accepted by pd.to_numeric
+NUMERIC_PATTERN = r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$"
+
+
+def _likely_numeric(values):
+    """True if more than 80% of the sampled values look like numbers.
+
+    A vectorised Arrow regex match instead of pd.to_numeric(errors="coerce"),
+    which raises and swallows an exception for every non-numeric cell.
+    """
+    sample = pc.utf8_trim_whitespace(pa.array(values, type=pa.string()))
+    is_num = pc.match_substring_regex(sample, NUMERIC_PATTERN)
+    numeric_count = pc.sum(is_num.cast(pa.int32())).as_py() or 0
+    return numeric_count > (len(sample) * 0.8)
+
+
+def profile_dataset_manual(dataset_name, chunks, config, sample_size=1_000_000):
+    """Stream chunks through update_stats and return (stats, report sample)."""
+    state = init_stats(dataset_name, config, sample_size)
+    for chunk in chunks:
+        update_stats(state, chunk)
+    return finalize_stats(state)
+
+
+# ============================================================
+# STEP 1b: POLARS ENGINE (optional — --engine=polars)
+# ============================================================
+
+def profile_dataset_polars(dataset_name, config, sample_size=1_000_000, columns=None):
+    """Profile a dataset with one fused Polars query; same output as the manual path.
+
+    Every statistic is an expression in a single select(), so the whole file
+    is scanned once by Polars' multi-threaded streaming engine.
+    """
+    import polars as pl
+
+    filepath = resolve_dataset_path(config)
+    if filepath is None:
+        return None, None
+
+    print(f"  📂 Scanning {filepath} with Polars...")
+
+    read_kwargs = dict(
+        separator="\t",
+        null_values=["\\N"],       # IMDb uses \N for null
+        quote_char=None,            # IMDb TSVs have no quoting
+        infer_schema_length=0,      # Load everything as string
+        empty_string_is_null=False, # Keep "" apart from \N, as the Arrow path does
+    )
+    snapshot = snapshot_path(filepath)
+    if PARQUET_SNAPSHOTS and _is_fresh(snapshot, filepath):
+        print(f"  ⚡ Using Parquet snapshot {snapshot}")
+        # Dictionary columns come back Categorical; profile them as strings
+        lf = pl.scan_parquet(snapshot).with_columns(pl.all().cast(pl.String))
+    elif filepath.endswith(".gz"):
+        # scan_csv cannot stream compressed input
+        lf = pl.read_csv(filepath, **read_kwargs).lazy()
+    else:
+        lf = pl.scan_csv(filepath, **read_kwargs)
+
+    if columns:
+        # Projection pushdown: the scan only materialises these columns
+        lf = lf.select([c for c in lf.collect_schema().names() if c in columns])
+
+    columns = lf.collect_schema().names()
+    sep = config.get("multi_value_separator")
+    mv_cols = [c for c in config.get("multi_value_columns", []) if c in columns]
     pk = config.get("primary_key")
     ck = config.get("composite_key")
 
+    exprs = [pl.len().alias("__rows")]
+    for col in columns:
+        non_null = pl.col(col).drop_nulls()
+        stripped = pl.col(col).str.strip_chars()
+        exprs += [
+            pl.col(col).null_count().alias(f"{col}__null"),
+            non_null.n_unique().alias(f"{col}__unique"),
+            non_null.head(1000).implode().alias(f"{col}__head"),
+            (stripped == "").sum().alias(f"{col}__empty"),
+            (stripped.str.to_lowercase() == "none").sum().alias(f"{col}__none"),
+            (stripped.str.to_lowercase() == "unknown").sum().alias(f"{col}__unknown"),
+        ]
+        if col in ID_COLUMNS:
+            exprs.append((~non_null.str.contains(ID_PATTERNS[col])).sum().alias(f"{col}__malformed"))
+    for col in mv_cols:
+        splits = pl.col(col).drop_nulls().str.split(sep)
+        lengths, exploded = splits.list.len(), splits.explode()
+        exprs += [
+            lengths.min().alias(f"{col}__mv_min"),
+            lengths.max().alias(f"{col}__mv_max"),
+            lengths.mean().alias(f"{col}__mv_avg"),
+            exploded.n_unique().alias(f"{col}__mv_unique"),
+            exploded.value_counts(sort=True).head(10).implode().alias(f"{col}__mv_top"),
+        ]
     if pk:
-        pk_nulls = df[pk].isna().sum()
-        pk_dupes = df[pk].duplicated().sum()
-        stats["primary_key"] = {
-            "column": pk,
-            "null_count": int(pk_nulls),
-            "duplicate_count": int(pk_dupes),
-            "is_valid_pk": pk_nulls == 0 and pk_dupes == 0,
-        }
+        exprs += [
+            pl.col(pk).null_count().alias("__pk_null"),
+            (pl.col(pk).count() - pl.col(pk).drop_nulls().n_unique()).alias("__pk_dupes"),
+        ]
     elif ck:
-        ck_nulls = df[ck].isna().any(axis=1).sum()
-        ck_dupes = df.duplicated(subset=ck).sum()
+        has_null = pl.any_horizontal([pl.col(k).is_null() for k in ck])
+        non_null_keys = pl.struct(ck).filter(~has_null)
+        exprs += [
+            has_null.sum().alias("__pk_null"),
+            (non_null_keys.len() - non_null_keys.n_unique()).alias("__pk_dupes"),
+        ]
+
+    row = lf.select(exprs).collect(engine="streaming").row(0, named=True)
+
+    # ----- Convert the single result row back to the stats dict shape -----
+    row_count = row["__rows"]
+    stats = {
+        "dataset": dataset_name,
+        "description": config["description"],
+        "file": config["file"],
+        "row_count": row_count,
+        "column_count": len(columns),
+        "columns": {},
+        "multi_value_analysis": {},
+    }
+
+    for col in columns:
+        null_count = row[f"{col}__null"]
+        unique_count = row[f"{col}__unique"]
+        stats["columns"][col] = {
+            "pandas_dtype": "String",
+            "null_count": null_count,
+            "null_percentage": round((null_count / row_count) * 100, 2) if row_count else 0,
+            "unique_count": unique_count,
+            "cardinality_ratio": round((unique_count / row_count) * 100, 2) if row_count else 0,
+            "sample_values": row[f"{col}__head"][:5],
+            "empty_string_count": row[f"{col}__empty"],
+            "none_literal_count": row[f"{col}__none"],
+            "unknown_literal_count": row[f"{col}__unknown"],
+            "likely_numeric": _likely_numeric(row[f"{col}__head"]),
+        }
+        if col in ID_COLUMNS:
+            stats["columns"][col]["malformed_id_count"] = row[f"{col}__malformed"]
+
+    for col in mv_cols:
+        avg = row[f"{col}__mv_avg"]
+        stats["multi_value_analysis"][col] = {
+            "min_values_per_row": row[f"{col}__mv_min"] or 0,
+            "max_values_per_row": row[f"{col}__mv_max"] or 0,
+            "avg_values_per_row": round(avg, 2) if avg is not None else 0,
+            "total_distinct_values": row[f"{col}__mv_unique"],
+            "top_10_values": {v[col]: v["count"] for v in row[f"{col}__mv_top"]},
+        }
+
+    if pk or ck:
+        pk_nulls, pk_dupes = row["__pk_null"], row["__pk_dupes"]
         stats["primary_key"] = {
-            "column": ck,
-            "null_count": int(ck_nulls),
-            "duplicate_count": int(ck_dupes),
-            "is_valid_pk": ck_nulls == 0 and ck_dupes == 0,
+            "column": pk or ck,
+            "null_count": pk_nulls,
+            "duplicate_count": pk_dupes,
+            "is_valid_pk": pk_nulls == 0 and pk_dupes == 0,
         }
 
-    return stats
+    if not sample_size:
+        return stats, None
+
+    # ----- Random sample for the ydata report (second, row-filtered scan) -----
+    rng = np.random.default_rng(42)
+    idx = rng.choice(row_count, size=min(sample_size, row_count), replace=False)
+    sample = (
+        lf.with_row_index("__row")
+        .filter(pl.col("__row").is_in(idx))
+        .drop("__row")
+        .collect(engine="streaming")
+        .to_pandas(use_pyarrow_extension_array=True)
+    )
+
+    return stats, sample
 
 
 # ============================================================
 # STEP 2: YDATA-PROFILING (HTML Reports)
 # ============================================================
 
-def generate_ydata_report(dataset_name, df, config):
-    """Generate ydata-profiling HTML report (minimal mode for large datasets)."""
+def generate_ydata_report(dataset_name, df_sample, row_count, config):
+    """Generate ydata-profiling HTML report (minimal mode for large datasets).
+
+    df_sample is the random sample kept while streaming (see finalize_stats).
+    """
     try:
         from ydata_profiling import ProfileReport
     except ImportError:
@@ -183,16 +938,18 @@ def generate_ydata_report(dataset_name, df, config):
     print(f"  📊 Generating ydata-profiling report for {dataset_name}...")
 
     # Use minimal=True for large datasets (>1M rows) to avoid OOM
-    minimal = len(df) > 1_000_000
+    minimal = row_count > 1_000_000
 
     if minimal:
-        print(f"  ⚡ Using MINIMAL mode ({len(df):,} rows is large)")
-        # Sample for profiling to keep it manageable
-        sample_size = min(500_000, len(df))
-        df_sample = df.sample(n=sample_size, random_state=42)
-        title_suffix = f" (sampled {sample_size:,}/{len(df):,} rows)"
+        print(f"  ⚡ Using MINIMAL mode ({row_count:,} rows is large)")
+        # Sample for profiling to keep it manageable (a no-op when the
+        # sample came through write_report_sample, which already cut it)
+        if len(df_sample) > 500_000:
+            df_sample = df_sample.take(_subsample_positions(len(df_sample), 500_000))
+
+    if len(df_sample) < row_count:
+        title_suffix = f" (sampled {len(df_sample):,}/{row_count:,} rows)"
     else:
-        df_sample = df
         title_suffix = ""
 
     profile = ProfileReport(
@@ -208,6 +965,48 @@ def generate_ydata_report(dataset_name, df, config):
     print(f"  ✅ Saved: {output_path}")
 
 
+def _subsample_positions(n, k):
+    """Sorted positions of k rows drawn uniformly without replacement from n.
+
+    Sorted so a take() over them reads the source buffers front to back.
+    """
+    idx = np.random.default_rng(42).choice(n, size=k, replace=False)
+    idx.sort()
+    return idx
+
+
+def write_report_sample(dataset_name, sample, row_count):
+    """Write the report sample to a temporary Feather file; returns its path.
+
+    Only what generate_ydata_report will use is written (500k rows in
+    minimal mode), so the report process reads no more than it needs.
+    The cut is an Arrow take() on the (zero-copy) table, so the only copy
+    made is of the kept rows.
+    """
+    table = pa.Table.from_pandas(sample, preserve_index=False)
+    if row_count > 1_000_000 and len(table) > 500_000:
+        table = table.take(_subsample_positions(len(table), 500_000))
+    path = os.path.join(tempfile.gettempdir(), f"imdb_{dataset_name}_sample.feather")
+    feather.write_feather(table, path)
+    return path
+
+
+def _render_report(sample_path, dataset_name, row_count, config):
+    """Report-process entry point: load the Feather sample and render the HTML.
+
+    ydata-profiling needs NumPy/object-backed columns (its describers call
+    reductions such as kurt that ArrowExtensionArray does not support), so
+    the sample is converted with no Arrow types mapper, ignoring the
+    pd.ArrowDtype pandas metadata written with it. Only the stats path
+    keeps Arrow-backed columns.
+    """
+    try:
+        df_sample = feather.read_table(sample_path).to_pandas(ignore_metadata=True)
+        generate_ydata_report(dataset_name, df_sample, row_count, config)
+    finally:
+        os.remove(sample_path)
+
+
 # ============================================================
 # STEP 3: GENERATE SUMMARY MARKDOWN
 # ============================================================
@@ -224,14 +1023,13 @@ def generate_summary_markdown(all_stats):
     lines.append("## Dataset Overview\n")
     lines.append("| # | Dataset | File | Rows | Columns | Description |")
     lines.append("|---|---------|------|------|---------|-------------|")
-    total_rows = 0
-    for i, (name, stats) in enumerate(all_stats.items(), 1):
-        lines.append(
-            f"| {i} | `{name}` | `{stats['file']}` | "
-            f"{stats['row_count']:,} | {stats['column_count']} | "
-            f"{stats['description']} |"
-        )
-        total_rows += stats["row_count"]
+    lines.extend(
+        f"| {i} | `{name}` | `{stats['file']}` | "
+        f"{stats['row_count']:,} | {stats['column_count']} | "
+        f"{stats['description']} |"
+        for i, (name, stats) in enumerate(all_stats.items(), 1)
+    )
+    total_rows = sum(stats["row_count"] for stats in all_stats.values())
     lines.append(f"\n**Total rows across all datasets: {total_rows:,}**\n")
 
     # ---- Per-Dataset Deep Dive ----
@@ -250,6 +1048,10 @@ def generate_summary_markdown(all_stats):
             if not pk["is_valid_pk"]:
                 lines.append(f"  - Null count: {pk['null_count']:,}")
                 lines.append(f"  - Duplicate count: {pk['duplicate_count']:,}")
+                if isinstance(pk["column"], str):
+                    malformed = stats["columns"].get(pk["column"], {}).get("malformed_id_count")
+                    if malformed:
+                        lines.append(f"  - Malformed IDs: {malformed:,}")
             lines.append("")
 
         # Column-Level Stats
@@ -262,27 +1064,29 @@ def generate_summary_markdown(all_stats):
             "|--------|-----------|--------|-------------|"
             "--------------|----------------|---------------|"
         )
-        for col, cs in stats["columns"].items():
-            sample = ", ".join([str(v) for v in cs.get("sample_values", [])[:3]])
-            numeric = cs.get("likely_numeric", "N/A")
-            lines.append(
-                f"| `{col}` | {cs['null_count']:,} | {cs['null_percentage']}% | "
-                f"{cs['unique_count']:,} | {cs['cardinality_ratio']}% | "
-                f"{numeric} | {sample} |"
-            )
+        # One generator per table: rows go straight into lines
+        lines.extend(
+            f"| `{col}` | {cs['null_count']:,} | {cs['null_percentage']}% | "
+            f"{cs['unique_count']:,} | {cs['cardinality_ratio']}% | "
+            f"{cs.get('likely_numeric', 'N/A')} | "
+            f"{', '.join(str(v) for v in cs.get('sample_values', [])[:3])} |"
+            for col, cs in stats["columns"].items()
+        )
 
         # Empty String / "none" Literal Check
-        has_issues = False
-        for col, cs in stats["columns"].items():
-            empty = cs.get("empty_string_count", 0)
-            none_lit = cs.get("none_literal_count", 0)
-            if empty > 0 or none_lit > 0:
-                if not has_issues:
-                    lines.append("\n### ⚠️ Data Quality Flags\n")
-                    lines.append("| Column | Empty Strings | 'none' Literals |")
-                    lines.append("|--------|--------------|-----------------|")
-                    has_issues = True
-                lines.append(f"| `{col}` | {empty:,} | {none_lit:,} |")
+        flagged = [
+            (col, cs.get("empty_string_count", 0), cs.get("none_literal_count", 0))
+            for col, cs in stats["columns"].items()
+        ]
+        flagged = [row for row in flagged if row[1] > 0 or row[2] > 0]
+        if flagged:
+            lines.append("\n### ⚠️ Data Quality Flags\n")
+            lines.append("| Column | Empty Strings | 'none' Literals |")
+            lines.append("|--------|--------------|-----------------|")
+            lines.extend(
+                f"| `{col}` | {empty:,} | {none_lit:,} |"
+                for col, empty, none_lit in flagged
+            )
 
         # Multi-Value Analysis
         if stats["multi_value_analysis"]:
@@ -295,14 +1099,13 @@ def generate_summary_markdown(all_stats):
                 "|--------|-----------|-----------|-----------|"
                 "----------------|--------------|"
             )
-            for mv_col, mv in stats["multi_value_analysis"].items():
-                top3 = list(mv["top_10_values"].keys())[:3]
-                top3_str = ", ".join(top3)
-                lines.append(
-                    f"| `{mv_col}` | {mv['min_values_per_row']} | "
-                    f"{mv['max_values_per_row']} | {mv['avg_values_per_row']} | "
-                    f"{mv['total_distinct_values']:,} | {top3_str} |"
-                )
+            lines.extend(
+                f"| `{mv_col}` | {mv['min_values_per_row']} | "
+                f"{mv['max_values_per_row']} | {mv['avg_values_per_row']} | "
+                f"{mv['total_distinct_values']:,} | "
+                f"{', '.join(list(mv['top_10_values'])[:3])} |"
+                for mv_col, mv in stats["multi_value_analysis"].items()
+            )
 
             lines.append("\n**Why this matters:** These multi-value fields need to be "
                          "`exploded` in the Silver layer to create proper bridge table "
@@ -314,10 +1117,10 @@ def generate_summary_markdown(all_stats):
     lines.append("Use this table to validate Bronze ingestion matches source:\n")
     lines.append("| Dataset | Source Row Count | Bronze Row Count | Match? |")
     lines.append("|---------|----------------|-----------------|--------|")
-    for name, stats in all_stats.items():
-        lines.append(
-            f"| `{name}` | {stats['row_count']:,} | _fill after Bronze load_ | ⬜ |"
-        )
+    lines.extend(
+        f"| `{name}` | {stats['row_count']:,} | _fill after Bronze load_ | ⬜ |"
+        for name, stats in all_stats.items()
+    )
 
     # ---- Key Findings / Cleaning Decisions ----
     lines.append("\n---\n")
@@ -342,39 +1145,188 @@ def generate_summary_markdown(all_stats):
 # MAIN EXECUTION
 # ============================================================
 
-def main():
-    print("=" * 60)
-    print("IMDb Data Profiling — Starting")
-    print("=" * 60)
+def profile_one(dataset_name, config, engine="pandas", keys_only=False):
+    """Load and profile one dataset; returns (dataset_name, stats, sample_path).
 
-    all_stats = {}
+    stats is None if the file is missing; sample_path (a Feather file for the
+    ydata report) is None when there is no report to render.
 
-    for dataset_name, config in DATASETS.items():
-        print(f"\n{'─' * 50}")
-        print(f"📁 Processing: {dataset_name}")
-        print(f"{'─' * 50}")
+    keys_only reads just key_columns(config) and takes no report sample.
 
-        # Load
-        df = load_dataset(dataset_name, config)
-        if df is None:
-            continue
+    Runs in a worker process, so it only touches module-level configuration.
+    """
+    print(f"📁 Processing: {dataset_name}")
+    columns = key_columns(config) if keys_only else None
+    sample_size = 0 if keys_only else 1_000_000
+
+    if engine == "polars":
+        stats, sample = profile_dataset_polars(dataset_name, config, sample_size, columns)
+        if stats is None:
+            return dataset_name, None, None
+    else:
+        # Load (lazily — chunks are parsed as the profiler pulls them)
+        chunks = load_dataset(dataset_name, config, columns)
+        if chunks is None:
+            return dataset_name, None, None
 
         # Manual profiling
-        stats = profile_dataset_manual(dataset_name, df, config)
-        all_stats[dataset_name] = stats
+        stats, sample = profile_dataset_manual(dataset_name, chunks, config, sample_size)
+    print(f"  ✅ {dataset_name}: profiled {stats['row_count']:,} rows × {stats['column_count']} columns")
+
+    # ydata-profiling HTML report is rendered by the parent in a separate
+    # process; hand it the sample on disk and let this worker free it
+    sample_path = None
+    if sample is not None:
+        if importlib.util.find_spec("ydata_profiling") is None:
+            print("  ⚠️  ydata-profiling not installed. Skipping HTML report.")
+            print("     Install with: pip install ydata-profiling")
+        else:
+            sample_path = write_report_sample(dataset_name, sample, stats["row_count"])
+
+    return dataset_name, stats, sample_path
+
+
+def input_signature(config, engine):
+    """(path, size, mtime, engine) of a dataset's TSV or .gz, as a dict; None if missing.
+
+    The engine is part of the key: the two engines report different dtypes
+    and exact vs estimated unique counts, so neither reuses the other's stats.
+    """
+    filepath = os.path.join(RAW_DATA_DIR, config["file"])
+    for path in (filepath, filepath + ".gz"):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        return {"file": path, "size": st.st_size, "mtime": st.st_mtime, "engine": engine}
+    return None
+
+
+def _stats_path(dataset_name):
+    return os.path.join(OUTPUT_DIR, f"{dataset_name}_stats.json")
 
-        # ydata-profiling HTML report
-        generate_ydata_report(dataset_name, df, config)
 
-        # Free memory
-        del df
+def load_manifest():
+    """Previous run's {dataset: input signature}, or {} if there is none."""
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def load_cached_stats(dataset_name, signature, manifest):
+    """Cached stats if the input matches the manifest entry, else None."""
+    if signature is None or manifest.get(dataset_name) != signature:
+        return None
+    try:
+        with open(_stats_path(dataset_name)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_stats(dataset_name, stats):
+    with open(_stats_path(dataset_name), "w") as f:
+        json.dump(stats, f, indent=2)
+
+
+def _join_report(report, complete):
+    """Wait for a (dataset_name, process) report, if any.
+
+    Adds the dataset to complete if the report was saved; warns otherwise.
+    """
+    if report is None:
+        return
+    dataset_name, proc = report
+    proc.join()
+    if proc.exitcode != 0:
+        print(f"  ⚠️  {proc.name} exited with code {proc.exitcode}; HTML report not saved.")
+        return
+    complete.add(dataset_name)
+
+
+def main(engine="pandas", workers=None, force=False, keys_only=False):
+    print("=" * 60)
+    print(f"IMDb Data Profiling — Starting (engine: {engine})")
+    print("=" * 60)
+
+    # Create output directory if it doesn't exist
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    all_stats = {}
+    report = None   # (dataset_name, process) of the HTML report in flight
+
+    # Skip datasets whose input is byte-for-byte where the last run left it
+    # (keys-only stats are partial, so they neither use nor feed the cache)
+    manifest = {} if force or keys_only else load_manifest()
+    signatures = {name: input_signature(cfg, engine) for name, cfg in DATASETS.items()}
+    cached = {}
+    for dataset_name in DATASETS:
+        stats = load_cached_stats(dataset_name, signatures[dataset_name], manifest)
+        if stats is not None:
+            print(f"♻️  {dataset_name}: input unchanged, using cached stats")
+            cached[dataset_name] = stats
+    pending = [name for name in DATASETS if name not in cached]
+    # Datasets whose stats and HTML report (if any) are both done; only these
+    # go into the manifest, so a failed report is retried on the next run
+    complete = set(cached)
+
+    # The 7 files are independent: profile them in parallel processes.
+    # spawn (not fork) so Arrow/Polars thread pools start clean in each child.
+    ctx = multiprocessing.get_context("spawn")
+    workers = workers or min(max(len(pending), 1), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+        results = ex.map(
+            profile_one,
+            pending,
+            [DATASETS[name] for name in pending],
+            [engine] * len(pending),
+            [keys_only] * len(pending),
+        )
+        # map() yields in submission order (pending keeps DATASETS order), so
+        # interleaving the cached entries keeps the summary in DATASETS order
+        for dataset_name in DATASETS:
+            if dataset_name in cached:
+                all_stats[dataset_name] = cached[dataset_name]
+                continue
+            _, stats, sample_path = next(results)
+            if stats is None:
+                continue
+            all_stats[dataset_name] = stats
+            if not keys_only:
+                save_stats(dataset_name, stats)
+
+            if sample_path:
+                # One HTML report at a time (each holds its sample plus
+                # ydata's copies), overlapping with the profiling workers.
+                # A report that runs out of memory only kills its own process.
+                _join_report(report, complete)
+                proc = ctx.Process(
+                    target=_render_report,
+                    args=(sample_path, dataset_name, stats["row_count"], DATASETS[dataset_name]),
+                    name=f"report-{dataset_name}",
+                )
+                proc.start()
+                report = (dataset_name, proc)
+            else:
+                complete.add(dataset_name)
+
+    _join_report(report, complete)
+
+    # Record the inputs behind every complete dataset's stats file
+    if not keys_only:
+        with open(MANIFEST_PATH, "w") as f:
+            json.dump({name: signatures[name] for name in all_stats if name in complete}, f, indent=2)
 
     # Generate summary markdown
     print(f"\n{'─' * 50}")
     print("📝 Generating profiling summary markdown...")
     summary_md = generate_summary_markdown(all_stats)
 
-    summary_path = os.path.join(OUTPUT_DIR, "profiling_summary.md")
+    # A keys-only run must not overwrite the full summary
+    summary_name = "profiling_summary_keys.md" if keys_only else "profiling_summary.md"
+    summary_path = os.path.join(OUTPUT_DIR, summary_name)
     with open(summary_path, "w") as f:
         f.write(summary_md)
     print(f"✅ Saved: {summary_path}")
@@ -387,86 +1339,31 @@ def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the 7 IMDb datasets.")
+    parser.add_argument(
+        "--engine",
+        choices=["pandas", "polars"],
+        default="pandas",
+        help="pandas: chunked PyArrow/pandas streaming (default); "
+             "polars: one fused Polars query per dataset (pip install polars)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Datasets profiled in parallel (default: min(7, CPU count))",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-profile every dataset, ignoring the manifest of unchanged inputs",
+    )
+    parser.add_argument(
+        "--keys-only",
+        action="store_true",
+        help="Read only the key and multi-value columns: PK validation and "
+             "multi-value stats, no HTML reports (→ profiling_summary_keys.md)",
+    )
+    args = parser.parse_args()
 
-    # -----------------------------------------------------------
-    # CONFIGURATION — Update these paths to match your setup
-    # -----------------------------------------------------------
-
-    # Project root (IMDB_Project) so paths are consistent
-    ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-
-    # Where your raw .tsv files are stored (unzipped)
-    RAW_DATA_DIR = os.path.join(ROOT_DIR, "data")
-
-    # Where profiling outputs will be saved
-    OUTPUT_DIR = os.path.join(ROOT_DIR, "docs", "profiling")
-
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    # -----------------------------------------------------------
-    # DATASET DEFINITIONS
-    # -----------------------------------------------------------
-    # Each entry: (filename, description, expected_key, multi_value_columns)
-
-    DATASETS = {
-        "name_basics": {
-            "file": "name.basics.tsv",
-            "description": "Cast & crew personnel details",
-            "primary_key": "nconst",
-            "multi_value_columns": ["primaryProfession", "knownForTitles"],
-            "multi_value_separator": ",",
-            "null_marker": "\\N",  # IMDb uses \N for nulls
-        },
-        "title_basics": {
-            "file": "title.basics.tsv",
-            "description": "Title metadata and genres",
-            "primary_key": "tconst",
-            "multi_value_columns": ["genres"],
-            "multi_value_separator": ",",
-            "null_marker": "\\N",
-        },
-        "title_akas": {
-            "file": "title.akas.tsv",
-            "description": "Localized title names (multi-language/region)",
-            "primary_key": None,  # Composite: titleId + ordering
-            "composite_key": ["titleId", "ordering"],
-            "multi_value_columns": [],
-            "multi_value_separator": None,
-            "null_marker": "\\N",
-        },
-        "title_crew": {
-            "file": "title.crew.tsv",
-            "description": "Directors and writers per title",
-            "primary_key": "tconst",
-            "multi_value_columns": ["directors", "writers"],
-            "multi_value_separator": ",",
-            "null_marker": "\\N",
-        },
-        "title_episode": {
-            "file": "title.episode.tsv",
-            "description": "Series ↔ episode relationships",
-            "primary_key": "tconst",
-            "multi_value_columns": [],
-            "multi_value_separator": None,
-            "null_marker": "\\N",
-        },
-        "title_principals": {
-            "file": "title.principals.tsv",
-            "description": "Principal cast/crew credits per title",
-            "primary_key": None,  # Composite: tconst + ordering
-            "composite_key": ["tconst", "ordering"],
-            "multi_value_columns": [],
-            "multi_value_separator": None,
-            "null_marker": "\\N",
-        },
-        "title_ratings": {
-            "file": "title.ratings.tsv",
-            "description": "Average ratings and vote counts",
-            "primary_key": "tconst",
-            "multi_value_columns": [],
-            "multi_value_separator": None,
-            "null_marker": "\\N",
-        },
-    }
-    main()
+    main(engine=args.engine, workers=args.workers, force=args.force, keys_only=args.keys_only)
@@ -36,6 +36,45 @@ RAW_PATH = "/FileStore/imdb_raw"  # UPDATE THIS to your path
 # If using Unity Catalog volumes instead:
 # RAW_PATH = "/Volumes/your_catalog/your_schema/imdb_raw"
 
+# Convert each TSV to Parquet once (under PARQUET_PATH) and profile from the
+# snapshot on every later run; set REBUILD_PARQUET after re-uploading a TSV
+PARQUET_SNAPSHOTS = True
+PARQUET_PATH = f"{RAW_PATH}_parquet"
+REBUILD_PARQUET = False
+
+# Cardinality is estimated with HyperLogLog (±2%); set True to count the
+# primary key columns exactly (a full distributed distinct — much slower)
+EXACT_PK_CARDINALITY = False
+
+# Files smaller than this are profiled on the driver with DuckDB instead of
+# Spark (%pip install duckdb; skipped automatically if it is not installed)
+DUCKDB_SMALL_FILES = True
+DUCKDB_MAX_FILE_MB = 200
+
+# Where each loaded dataset is cached (a pyspark StorageLevel name). The CSV
+# is decoded once into the cache. PySpark's MEMORY_AND_DISK is the serialized
+# level (Scala's MEMORY_AND_DISK_SER); use DISK_ONLY on small clusters
+CACHE_STORAGE_LEVEL = "MEMORY_AND_DISK"
+
+# Datasets profiled concurrently (one driver thread + scheduler pool each);
+# every in-flight dataset holds its own cache, so lower this on small clusters
+PARALLEL_DATASETS = 7
+
+# Cached DataFrames are stored as compressed columnar batches, so the
+# profiling aggregations scan only the columns they touch
+spark.conf.set("spark.sql.inMemoryColumnarStorage.compressed", "true")
+spark.conf.set("spark.sql.inMemoryColumnarStorage.batchSize", "10000")
+
+# Adaptive Query Execution: re-plans shuffles from runtime statistics
+spark.conf.set("spark.sql.adaptive.enabled", "true")
+
+# Most profiling aggregations collapse to a single row: coalesce their
+# post-shuffle partitions instead of launching 200 near-empty reduce tasks.
+# spark.sql.shuffle.partitions is left alone — it is session-wide, so it
+# would also apply to the key groupBys and to the other datasets' threads
+spark.conf.set("spark.sql.adaptive.coalescePartitions.enabled", "true")
+spark.conf.set("spark.sql.adaptive.coalescePartitions.minPartitionNum", "1")
+
 # Dataset definitions
 DATASETS = {
     "name_basics":      {"file": "name.basics.tsv",      "pk": "nconst",  "mv_cols": ["primaryProfession", "knownForTitles"]},
@@ -47,6 +86,31 @@ DATASETS = {
     "title_ratings":    {"file": "title.ratings.tsv",     "pk": "tconst",  "mv_cols": []},
 }
 
+# Read schemas (column names from the IMDb dataset docs), so Spark skips
+# inference. Every column is read as a string, as the DuckDB path does
+# (all_varchar): under PERMISSIVE a typed column would silently turn values
+# that fail to parse into nulls and count them in null_count, hiding exactly
+# what profiling is meant to find. Existing Parquet snapshots keep the types
+# they were written with — set REBUILD_PARQUET once after changing these.
+from pyspark.sql.types import StructType, StructField, StringType
+
+def tsv_schema(*columns):
+    """All-string StructType from column names."""
+    return StructType([StructField(c, StringType()) for c in columns])
+
+SCHEMAS = {
+    "name_basics":      tsv_schema("nconst", "primaryName", "birthYear", "deathYear",
+                                   "primaryProfession", "knownForTitles"),
+    "title_basics":     tsv_schema("tconst", "titleType", "primaryTitle", "originalTitle", "isAdult",
+                                   "startYear", "endYear", "runtimeMinutes", "genres"),
+    "title_akas":       tsv_schema("titleId", "ordering", "title", "region", "language", "types",
+                                   "attributes", "isOriginalTitle"),
+    "title_crew":       tsv_schema("tconst", "directors", "writers"),
+    "title_episode":    tsv_schema("tconst", "parentTconst", "seasonNumber", "episodeNumber"),
+    "title_principals": tsv_schema("tconst", "ordering", "nconst", "category", "job", "characters"),
+    "title_ratings":    tsv_schema("tconst", "averageRating", "numVotes"),
+}
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -54,12 +118,24 @@ DATASETS = {
 
 # COMMAND ----------
 
+from pyspark import StorageLevel
 from pyspark.sql import functions as F
 from pyspark.sql.types import *
+from pyspark.sql.utils import AnalysisException
 
-def load_imdb_tsv(spark, dataset_name, config):
-    """Load an IMDb TSV file into a Spark DataFrame."""
+def read_source(spark, dataset_name, config):
+    """Return a dataset's source DataFrame: its Parquet snapshot if one exists,
+    otherwise the raw TSV (converted to a snapshot first when enabled)."""
     filepath = f"{RAW_PATH}/{config['file']}"
+    snapshot = f"{PARQUET_PATH}/{dataset_name}"
+    
+    if PARQUET_SNAPSHOTS and not REBUILD_PARQUET:
+        try:
+            df = spark.read.parquet(snapshot)
+            print(f"  ⚡ {dataset_name}: reading Parquet snapshot {snapshot}")
+            return df
+        except AnalysisException:
+            pass  # first run: no snapshot yet
     
     df = (
         spark.read
@@ -67,74 +143,152 @@ def load_imdb_tsv(spark, dataset_name, config):
         .option("sep", "\t")
         .option("quote", "")          # IMDb TSVs have no quoting
         .option("nullValue", "\\N")   # IMDb uses \N for nulls
+        .schema(SCHEMAS[dataset_name])  # header row is skipped, not inferred
         .csv(filepath)
     )
+    if not PARQUET_SNAPSHOTS:
+        return df
     
-    print(f"✅ {dataset_name}: {df.count():,} rows × {len(df.columns)} columns")
-    return df
+    # One-time conversion: the only CSV decode; every later run (and every
+    # query in this one) reads columnar snappy Parquet instead
+    print(f"  💾 {dataset_name}: converting {filepath} → {snapshot}")
+    df.write.mode("overwrite").option("compression", "snappy").parquet(snapshot)
+    return spark.read.parquet(snapshot)
 
 
-def profile_columns(df, dataset_name):
-    """Generate per-column profiling stats."""
-    total_rows = df.count()
-    results = []
+def load_imdb_tsv(spark, dataset_name, config):
+    """Load an IMDb dataset into a cached Spark DataFrame; returns (df, row_count).
+
+    The count is the action that materializes the cache, so the source is
+    read once and every profiling query after it reads the cached rows.
+    """
+    df = read_source(spark, dataset_name, config).persist(
+        getattr(StorageLevel, CACHE_STORAGE_LEVEL)
+    )
+    # The materialization action: the only full pass over the source
+    try:
+        row_count = df.count()
+    except Exception:
+        df.unpersist()   # drop any partially cached blocks
+        raise
     
-    for col_name in df.columns:
+    print(f"✅ {dataset_name}: {row_count:,} rows × {len(df.columns)} columns")
+    return df, row_count
+
+
+def profile_columns(df, dataset_name, total_rows, exact_cols=()):
+    """Generate per-column profiling stats.
+
+    A cheap COUNT(col) pre-pass gives every column's null count and finds
+    the all-null columns; the distinct/empty/'none' expressions for the rest
+    go into one df.agg(), so the table is scanned by two Spark jobs instead
+    of one job per column. Unique counts are HyperLogLog estimates
+    (rsd=0.02) except for exact_cols.
+    """
+    non_null = df.agg(*[F.count(F.col(c)).alias(c) for c in df.columns]).collect()[0]
+    # Nothing to learn from an all-null column: skip its expensive expressions
+    live_cols = [c for c in df.columns if non_null[c] > 0]
+    
+    aggs = []
+    for col_name in live_cols:
         col = F.col(col_name)
-        
-        stats = df.select(
-            F.lit(dataset_name).alias("dataset"),
-            F.lit(col_name).alias("column_name"),
-            F.lit(total_rows).alias("total_rows"),
-            
-            # Null analysis
-            F.sum(F.when(col.isNull(), 1).otherwise(0)).alias("null_count"),
-            F.round(
-                (F.sum(F.when(col.isNull(), 1).otherwise(0)) / total_rows) * 100, 2
-            ).alias("null_pct"),
-            
+        aggs += [
             # Cardinality
-            F.countDistinct(col).alias("unique_count"),
-            F.round((F.countDistinct(col) / total_rows) * 100, 2).alias("cardinality_pct"),
+            (
+                F.countDistinct(col) if col_name in exact_cols
+                else F.approx_count_distinct(col, rsd=0.02)
+            ).alias(f"{col_name}__uniq"),
             
             # Empty string check
-            F.sum(F.when(F.trim(col) == "", 1).otherwise(0)).alias("empty_string_count"),
+            F.sum(F.when(F.trim(col) == "", 1).otherwise(0)).alias(f"{col_name}__empty"),
             
             # "none" literal check
-            F.sum(F.when(F.lower(F.trim(col)) == "none", 1).otherwise(0)).alias("none_literal_count"),
-        ).collect()[0]
-        
-        results.append(stats.asDict())
+            F.sum(F.when(F.lower(F.trim(col)) == "none", 1).otherwise(0)).alias(f"{col_name}__none"),
+        ]
+    
+    row = df.agg(*aggs).collect()[0] if aggs else None
+    
+    results = []
+    for col_name in df.columns:
+        null_count = total_rows - non_null[col_name]
+        if col_name in live_cols:
+            counts = (row[f"{col_name}__uniq"], row[f"{col_name}__empty"], row[f"{col_name}__none"])
+        else:
+            counts = (0, 0, 0)
+        results.append(column_result(dataset_name, col_name, total_rows, null_count, *counts))
     
     return results
 
 
+def column_result(dataset_name, col_name, total_rows, null_count, unique_count,
+                  empty_string_count, none_literal_count):
+    """One column-stats row; percentages are plain arithmetic on the counts."""
+    return {
+        "dataset": dataset_name,
+        "column_name": col_name,
+        "total_rows": total_rows,
+        "null_count": null_count,
+        "null_pct": round(null_count / total_rows * 100, 2) if total_rows else 0.0,
+        "unique_count": unique_count,
+        "cardinality_pct": round(unique_count / total_rows * 100, 2) if total_rows else 0.0,
+        "empty_string_count": empty_string_count,
+        "none_literal_count": none_literal_count,
+    }
+
+
+# Explicit schemas for the result tables, so createDataFrame neither scans
+# the rows to infer types nor guesses from an all-null field
+COLUMN_STATS_SCHEMA = StructType([
+    StructField("dataset", StringType()),
+    StructField("column_name", StringType()),
+    StructField("total_rows", LongType()),
+    StructField("null_count", LongType()),
+    StructField("null_pct", DoubleType()),
+    StructField("unique_count", LongType()),
+    StructField("cardinality_pct", DoubleType()),
+    StructField("empty_string_count", LongType()),
+    StructField("none_literal_count", LongType()),
+])
+
+ROW_COUNT_SCHEMA = StructType([
+    StructField("dataset", StringType()),
+    StructField("file", StringType()),
+    StructField("row_count", LongType()),
+])
+
+
 def profile_primary_key(df, config):
-    """Validate primary key uniqueness and non-null."""
+    """Validate primary key uniqueness and non-null.
+
+    One groupBy over the key answers both questions: rows in the null group
+    are the null keys, and non-null groups with count > 1 are the duplicated
+    keys (null keys are reported once, as nulls, not again as duplicates).
+    """
     pk = config.get("pk")
     cpk = config.get("composite_pk")
+    key_cols = [pk] if pk else cpk
+    if not key_cols:
+        return None
     
-    if pk:
-        null_count = df.filter(F.col(pk).isNull()).count()
-        dupe_count = df.groupBy(pk).count().filter(F.col("count") > 1).count()
-        return {
-            "key_columns": pk,
-            "null_count": null_count,
-            "duplicate_count": dupe_count,
-            "is_valid": null_count == 0 and dupe_count == 0,
-        }
-    elif cpk:
-        null_count = df.filter(
-            F.col(cpk[0]).isNull() | F.col(cpk[1]).isNull()
-        ).count()
-        dupe_count = df.groupBy(cpk).count().filter(F.col("count") > 1).count()
-        return {
-            "key_columns": cpk,
-            "null_count": null_count,
-            "duplicate_count": dupe_count,
-            "is_valid": null_count == 0 and dupe_count == 0,
-        }
-    return None
+    is_null_key = F.col(key_cols[0]).isNull()
+    for c in key_cols[1:]:
+        is_null_key = is_null_key | F.col(c).isNull()
+    
+    counts = df.groupBy(*key_cols).count()
+    agg_row = counts.agg(
+        F.sum(F.when(is_null_key, F.col("count")).otherwise(0)).alias("nulls"),
+        F.sum(F.when((F.col("count") > 1) & ~is_null_key, 1).otherwise(0)).alias("dupes"),
+    ).collect()[0]
+    # sum() over an empty input is null
+    null_count = agg_row["nulls"] or 0
+    dupe_count = agg_row["dupes"] or 0
+    
+    return {
+        "key_columns": pk or cpk,
+        "null_count": null_count,
+        "duplicate_count": dupe_count,
+        "is_valid": null_count == 0 and dupe_count == 0,
+    }
 
 
 def profile_multi_value(df, mv_cols, separator=","):
@@ -142,33 +296,47 @@ def profile_multi_value(df, mv_cols, separator=","):
     results = {}
     
     for col_name in mv_cols:
-        non_null = df.filter(F.col(col_name).isNotNull())
-        
-        # Split and analyze
-        exploded = non_null.select(
-            F.explode(F.split(F.col(col_name), separator)).alias("value")
-        ).filter(F.trim(F.col("value")) != "")
-        
-        value_counts = exploded.groupBy("value").count().orderBy(F.desc("count"))
-        
-        # Stats
-        split_lengths = non_null.select(
-            F.size(F.split(F.col(col_name), separator)).alias("num_values")
+        # Split once and cache the arrays; every stat below reads them
+        # instead of re-scanning and re-splitting the column
+        split_df = (
+            df.select(col_name)                   # prune to the one column
+            .where(F.col(col_name).isNotNull())
+            .select(F.split(F.col(col_name), separator).alias("arr"))
+            # Same (serialized) level as the dataset cache; the length-stats
+            # query below is the action that materializes it
+            .persist(getattr(StorageLevel, CACHE_STORAGE_LEVEL))
         )
         
-        length_stats = split_lengths.select(
-            F.min("num_values").alias("min_values"),
-            F.max("num_values").alias("max_values"),
-            F.round(F.avg("num_values"), 2).alias("avg_values"),
-        ).collect()[0]
-        
-        distinct_count = exploded.select("value").distinct().count()
-        top_10 = value_counts.limit(10).collect()
+        try:
+            # Stats
+            length_stats = split_df.select(F.size("arr").alias("num_values")).agg(
+                F.min("num_values").alias("min_values"),
+                F.max("num_values").alias("max_values"),
+                F.avg("num_values").alias("avg_values"),
+            ).collect()[0]
+            
+            # Explode from the cached arrays
+            exploded = split_df.select(F.explode("arr").alias("value")).filter(F.trim(F.col("value")) != "")
+            
+            # Distinct values via a map-side HyperLogLog sketch (no shuffle of
+            # every distinct value); only the top 10 needs the grouped counts
+            distinct_count = exploded.agg(
+                F.approx_count_distinct("value", rsd=0.02).alias("distinct_count")
+            ).collect()[0]["distinct_count"]
+            # groupBy().count() runs a partial count per partition before the
+            # shuffle, and orderBy().limit() plans as TakeOrderedAndProject (a
+            # per-partition top 10, then a merge) — no full sort of the counts
+            value_counts = exploded.groupBy("value").count()
+            top_10 = value_counts.orderBy(F.desc("count")).limit(10).collect()
+        finally:
+            # Released even if a query fails, so it can't linger for the run
+            split_df.unpersist(blocking=True)
         
         results[col_name] = {
             "min_values_per_row": length_stats["min_values"],
             "max_values_per_row": length_stats["max_values"],
-            "avg_values_per_row": float(length_stats["avg_values"]),
+            # Rounded on the driver, not per row in the aggregation
+            "avg_values_per_row": round(float(length_stats["avg_values"]), 2),
             "total_distinct_values": distinct_count,
             "top_10": [(row["value"], row["count"]) for row in top_10],
         }
@@ -177,54 +345,198 @@ def profile_multi_value(df, mv_cols, separator=","):
 
 # COMMAND ----------
 
+# MAGIC %md
+# MAGIC ## Small Files — DuckDB on the Driver
+# MAGIC
+# MAGIC Files under `DUCKDB_MAX_FILE_MB` (e.g. `title.ratings.tsv`) are profiled in-process
+# MAGIC with DuckDB (`%pip install duckdb`): for inputs this size Spark's cost is task
+# MAGIC scheduling, not work. Results have the same shape as the Spark path.
+
+# COMMAND ----------
+
+import os
+import importlib.util
+
+def _local_path(path):
+    """Driver-local path of a DBFS or Unity Catalog volume file."""
+    return path if path.startswith("/Volumes") else f"/dbfs{path}"
+
+
+def use_duckdb(config):
+    """True if a dataset's TSV is small enough to profile on the driver."""
+    if not DUCKDB_SMALL_FILES or importlib.util.find_spec("duckdb") is None:
+        return False
+    try:
+        size_mb = os.path.getsize(_local_path(f"{RAW_PATH}/{config['file']}")) / (1 << 20)
+    except OSError:
+        return False
+    return size_mb < DUCKDB_MAX_FILE_MB
+
+
+def _q(col_name):
+    """Quote a column name as a DuckDB identifier."""
+    return '"' + col_name.replace('"', '""') + '"'
+
+
+def profile_with_duckdb(dataset_name, config, separator=","):
+    """Profile one dataset with DuckDB; returns (row_count, col_stats, pk_result, mv_results)."""
+    import duckdb
+    
+    filepath = _local_path(f"{RAW_PATH}/{config['file']}")
+    con = duckdb.connect()
+    # Parse once into an in-memory table; every query below reads it
+    con.execute(
+        f"CREATE TEMP TABLE t AS SELECT * FROM read_csv('{filepath}', delim='\t', "
+        f"header=true, quote='', escape='', nullstr='\\N', all_varchar=true)"
+    )
+    columns = [r[0] for r in con.execute("DESCRIBE t").fetchall()]
+    
+    # Column profiling — one query, exact distinct counts (the file is small)
+    exprs = ["COUNT(*)"]
+    for c in columns:
+        exprs += [
+            f"COUNT(*) - COUNT({_q(c)})",
+            f"COUNT(DISTINCT {_q(c)})",
+            f"COUNT(*) FILTER (WHERE trim({_q(c)}) = '')",
+            f"COUNT(*) FILTER (WHERE lower(trim({_q(c)})) = 'none')",
+        ]
+    row = con.execute(f"SELECT {', '.join(exprs)} FROM t").fetchone()
+    row_count = row[0]
+    col_stats = [
+        column_result(dataset_name, c, row_count, *row[1 + 4 * i : 5 + 4 * i])
+        for i, c in enumerate(columns)
+    ]
+    
+    # Primary key validation — same single grouped pass as the Spark path
+    pk_result = None
+    key_cols = [config["pk"]] if config["pk"] else config.get("composite_pk")
+    if key_cols:
+        keys = ", ".join(_q(c) for c in key_cols)
+        is_null_key = " OR ".join(f"{_q(c)} IS NULL" for c in key_cols)
+        null_count, dupe_count = con.execute(
+            f"SELECT COALESCE(SUM(cnt) FILTER (WHERE {is_null_key}), 0), "
+            f"COUNT(*) FILTER (WHERE cnt > 1 AND NOT ({is_null_key})) "
+            f"FROM (SELECT {keys}, COUNT(*) AS cnt FROM t GROUP BY {keys})"
+        ).fetchone()
+        pk_result = {
+            "key_columns": config["pk"] or key_cols,
+            "null_count": null_count,
+            "duplicate_count": dupe_count,
+            "is_valid": null_count == 0 and dupe_count == 0,
+        }
+    
+    # Multi-value analysis
+    mv_results = None
+    if config["mv_cols"]:
+        mv_results = {}
+        for col_name in config["mv_cols"]:
+            split = f"(SELECT string_split({_q(col_name)}, ?) AS arr FROM t WHERE {_q(col_name)} IS NOT NULL)"
+            values = f"(SELECT unnest(arr) AS value FROM {split}) WHERE trim(value) <> ''"
+            min_values, max_values, avg_values = con.execute(
+                f"SELECT MIN(len(arr)), MAX(len(arr)), AVG(len(arr)) FROM {split}",
+                [separator],
+            ).fetchone()
+            distinct_count = con.execute(
+                f"SELECT COUNT(DISTINCT value) FROM {values}", [separator]
+            ).fetchone()[0]
+            top_10 = con.execute(
+                f"SELECT value, COUNT(*) AS n FROM {values} GROUP BY value ORDER BY n DESC LIMIT 10",
+                [separator],
+            ).fetchall()
+            mv_results[col_name] = {
+                "min_values_per_row": min_values,
+                "max_values_per_row": max_values,
+                "avg_values_per_row": round(float(avg_values), 2),
+                "total_distinct_values": distinct_count,
+                "top_10": [(value, n) for value, n in top_10],
+            }
+    
+    con.close()
+    return row_count, col_stats, pk_result, mv_results
+
+# COMMAND ----------
+
 # MAGIC %md
 # MAGIC ## Run Profiling on All Datasets
 
 # COMMAND ----------
 
+from concurrent.futures import ThreadPoolExecutor
 from pyspark.sql import Row
 
-all_column_stats = []
-all_row_counts = []
-all_pk_results = {}
-all_mv_results = {}
+def profile_with_spark(name, config):
+    """Load and profile one dataset with Spark; same return shape as profile_with_duckdb."""
+    # Load (cached; row_count is the one full parse of the TSV)
+    df, row_count = load_imdb_tsv(spark, name, config)
+    
+    try:
+        # Column profiling
+        print(f"  📊 {name}: profiling columns...")
+        key_cols = [config["pk"]] if config["pk"] else config.get("composite_pk", [])
+        col_stats = profile_columns(df, name, row_count, key_cols if EXACT_PK_CARDINALITY else ())
+        
+        # Primary key validation
+        print(f"  🔑 {name}: validating primary key...")
+        pk_result = profile_primary_key(df, config)
+        
+        # Multi-value analysis
+        mv_results = None
+        if config["mv_cols"]:
+            print(f"  🔀 {name}: analyzing multi-value columns: {config['mv_cols']}")
+            mv_results = profile_multi_value(df, config["mv_cols"])
+    finally:
+        # Release the cached dataset as soon as this dataset is done (or
+        # failed), so it never holds storage memory the others need
+        df.unpersist(blocking=True)
+    
+    return row_count, col_stats, pk_result, mv_results
+
 
-for name, config in DATASETS.items():
-    print(f"\n{'='*60}")
+def profile_dataset(name, config):
+    """Profile one dataset (DuckDB if small, else Spark); runs in its own driver thread."""
+    # Jobs from this thread go to their own fair-scheduler pool, so a small
+    # file is not queued behind title_principals
+    spark.sparkContext.setLocalProperty("spark.scheduler.pool", name)
     print(f"📁 Profiling: {name}")
-    print(f"{'='*60}")
-    
-    # Load
-    df = load_imdb_tsv(spark, name, config)
-    row_count = df.count()
-    all_row_counts.append({"dataset": name, "file": config["file"], "row_count": row_count})
     
-    # Column profiling
-    print(f"  📊 Profiling columns...")
-    col_stats = profile_columns(df, name)
-    all_column_stats.extend(col_stats)
+    if use_duckdb(config):
+        print(f"  🦆 {name}: small file, profiling on the driver with DuckDB")
+        row_count, col_stats, pk_result, mv_results = profile_with_duckdb(name, config)
+        print(f"✅ {name}: {row_count:,} rows × {len(col_stats)} columns")
+    else:
+        row_count, col_stats, pk_result, mv_results = profile_with_spark(name, config)
     
-    # Primary key validation
-    print(f"  🔑 Validating primary key...")
-    pk_result = profile_primary_key(df, config)
     if pk_result:
         status = "✅ VALID" if pk_result["is_valid"] else "❌ INVALID"
-        print(f"     PK {pk_result['key_columns']}: {status} "
+        print(f"     {name} PK {pk_result['key_columns']}: {status} "
               f"(nulls={pk_result['null_count']}, dupes={pk_result['duplicate_count']})")
-        all_pk_results[name] = pk_result
+    for col, mv in (mv_results or {}).items():
+        print(f"     {name}.{col}: {mv['total_distinct_values']} distinct values, "
+              f"avg {mv['avg_values_per_row']} per row, "
+              f"max {mv['max_values_per_row']} per row")
     
-    # Multi-value analysis
-    if config["mv_cols"]:
-        print(f"  🔀 Analyzing multi-value columns: {config['mv_cols']}")
-        mv_results = profile_multi_value(df, config["mv_cols"])
-        all_mv_results[name] = mv_results
-        for col, mv in mv_results.items():
-            print(f"     {col}: {mv['total_distinct_values']} distinct values, "
-                  f"avg {mv['avg_values_per_row']} per row, "
-                  f"max {mv['max_values_per_row']} per row")
+    return row_count, col_stats, pk_result, mv_results
+
+
+all_column_stats = []
+all_row_counts = []
+all_pk_results = {}
+all_mv_results = {}
+
+# The 7 files are independent: profile them concurrently so small files
+# fill the cores a large file's tasks leave idle. Pools only share the
+# cluster fairly with spark.scheduler.mode FAIR in the cluster's Spark config
+with ThreadPoolExecutor(max_workers=PARALLEL_DATASETS) as pool:
+    results = pool.map(profile_dataset, DATASETS.keys(), DATASETS.values())
     
-    # Cache the row count for later
-    df.unpersist()
+    # map() yields in submission order, so the results keep DATASETS order
+    for (name, config), (row_count, col_stats, pk_result, mv_results) in zip(DATASETS.items(), results):
+        all_row_counts.append({"dataset": name, "file": config["file"], "row_count": row_count})
+        all_column_stats.extend(col_stats)
+        if pk_result:
+            all_pk_results[name] = pk_result
+        if mv_results:
+            all_mv_results[name] = mv_results
 
 print("\n✅ All profiling complete!")
 
@@ -235,9 +547,12 @@ print("\n✅ All profiling complete!")
 
 # COMMAND ----------
 
-# Display row counts as a table
-row_count_df = spark.createDataFrame(all_row_counts)
-display(row_count_df.orderBy("dataset"))
+import pandas as pd
+
+# The result lists are tiny (7 datasets, ~40 columns): display them as pandas
+# DataFrames on the driver instead of launching Spark jobs to sort them
+row_count_pdf = pd.DataFrame(all_row_counts)
+display(row_count_pdf.sort_values("dataset"))
 
 # COMMAND ----------
 
@@ -247,13 +562,8 @@ display(row_count_df.orderBy("dataset"))
 # COMMAND ----------
 
 # Display column stats
-col_stats_df = spark.createDataFrame(all_column_stats)
-display(
-    col_stats_df
-    .select("dataset", "column_name", "total_rows", "null_count", "null_pct", 
-            "unique_count", "cardinality_pct", "empty_string_count", "none_literal_count")
-    .orderBy("dataset", "column_name")
-)
+col_stats_pdf = pd.DataFrame(all_column_stats, columns=COLUMN_STATS_SCHEMA.fieldNames())
+display(col_stats_pdf.sort_values(["dataset", "column_name"]))
 
 # COMMAND ----------
 
@@ -265,11 +575,15 @@ display(
 # COMMAND ----------
 
 # Show only columns with data quality issues
+has_issues = (
+    (col_stats_pdf["null_pct"] > 0)
+    | (col_stats_pdf["empty_string_count"] > 0)
+    | (col_stats_pdf["none_literal_count"] > 0)
+)
 display(
-    col_stats_df
-    .filter((F.col("null_pct") > 0) | (F.col("empty_string_count") > 0) | (F.col("none_literal_count") > 0))
-    .select("dataset", "column_name", "null_count", "null_pct", "empty_string_count", "none_literal_count")
-    .orderBy(F.desc("null_pct"))
+    col_stats_pdf.loc[has_issues, ["dataset", "column_name", "null_count", "null_pct",
+                                   "empty_string_count", "none_literal_count"]]
+    .sort_values("null_pct", ascending=False)
 )
 
 # COMMAND ----------
@@ -313,7 +627,8 @@ for dataset, pk in all_pk_results.items():
 
 # COMMAND ----------
 
-# Save as Delta table for later validation
+# Save as Delta table for later validation (the one Spark job in this section)
+row_count_df = spark.createDataFrame(all_row_counts, schema=ROW_COUNT_SCHEMA)
 (
     row_count_df
     .withColumn("profiling_timestamp", F.current_timestamp())